@@ -0,0 +1,28 @@
+"""
+统计内核的AOT预编译脚本
+
+使用numba.pycc将statistics模块中的numba内核提前编译为扩展模块statistics_aot，
+导入statistics时优先加载预编译版本，避免短生命周期进程每次启动都支付JIT编译开销。
+
+用法（在项目根目录执行）:
+    python -m data_processing.utils._build_statistics_aot
+"""
+
+from pathlib import Path
+
+from numba.pycc import CC
+
+from data_processing.utils.statistics import _kendall_tau_b_sorted
+
+cc = CC('statistics_aot')
+cc.output_dir = str(Path(__file__).resolve().parent)
+
+
+@cc.export('kendall_tau_b_sorted', 'f8(f8[:], f8[:])')
+def kendall_tau_b_sorted(xs, ys):
+    """已排序数据的Kendall tau-b（float64）"""
+    return _kendall_tau_b_sorted(xs, ys)
+
+
+if __name__ == "__main__":
+    cc.compile()
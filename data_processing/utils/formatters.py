@@ -240,7 +240,7 @@ class JSONFormatter(DataFormatter):
         return {
             "type": "json",
             "content": json.dumps(
-                data,
+                StatisticsCalculator.to_jsonable(data),
                 indent=self.indent,
                 ensure_ascii=self.ensure_ascii
             )
@@ -289,7 +289,7 @@ class YAMLFormatter(DataFormatter):
         return {
             "type": "yaml",
             "content": yaml.dump(
-                data,
+                StatisticsCalculator.to_jsonable(data),
                 default_flow_style=self.default_flow_style,
                 encoding=self.encoding
             )
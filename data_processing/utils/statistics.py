@@ -5,7 +5,179 @@
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from scipy import stats
+from numba import njit, prange
+from scipy import special, stats
+
+# 样本量超过该值时使用O(n log n)的Kendall tau-b实现
+_KENDALL_FAST_MIN_SIZE = 500
+
+_SQRT_2PI = np.sqrt(2 * np.pi)
+# 与stats.linregress相同的数值保护项，避免|r|=1时除零
+_TINY = 1.0e-20
+
+
+def _kendall_tau_b(x: np.ndarray, y: np.ndarray) -> float:
+    """使用Knight算法计算Kendall tau-b相关系数
+    
+    先按(x, y)字典序排序，再由_kendall_tau_b_sorted对y做归并排序并统计
+    逆序对（不一致对）数量，总时间复杂度为O(n log n)。
+    
+    Args:
+        x: 第一个数组（float64）
+        y: 第二个数组（float64）
+    
+    Returns:
+        float: tau-b相关系数，任一数组为常数时返回nan
+    """
+    # 排序交给numpy完成：先按y排序，再按x稳定排序
+    order = np.argsort(y)
+    order = order[np.argsort(x[order], kind='stable')]
+    return _kendall_tau_b_sorted_impl(x[order], y[order])
+
+
+@njit(cache=True)
+def _kendall_tau_b_sorted(xs: np.ndarray, ys: np.ndarray) -> float:
+    """计算已按(x, y)字典序排序数据的Kendall tau-b
+    
+    统计并列对后，使用预分配缓冲区的自底向上归并排序计算y的逆序对数量。
+    使用numba加速计算。
+    
+    Args:
+        xs: 已排序的x数组
+        ys: 按相同顺序排列的y数组，计算过程中会被修改
+    
+    Returns:
+        float: tau-b相关系数，任一数组为常数时返回nan
+    """
+    n = xs.shape[0]
+    
+    # 统计x中的并列对数(n1)和x、y同时并列的对数(n3)
+    n0 = n * (n - 1) // 2
+    n1 = 0
+    n3 = 0
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and xs[j] == xs[i]:
+            j += 1
+        t = j - i
+        n1 += t * (t - 1) // 2
+        k = i
+        while k < j:
+            m = k + 1
+            while m < j and ys[m] == ys[k]:
+                m += 1
+            u = m - k
+            n3 += u * (u - 1) // 2
+            k = m
+        i = j
+    
+    # 自底向上归并排序y，统计逆序对数量（交换次数），两个缓冲区交替使用
+    src = ys
+    dst = np.empty_like(ys)
+    swaps = 0
+    width = 1
+    while width < n:
+        start = 0
+        while start < n:
+            mid = min(start + width, n)
+            end = min(start + 2 * width, n)
+            left = start
+            right = mid
+            pos = start
+            while left < mid and right < end:
+                if src[right] < src[left]:
+                    dst[pos] = src[right]
+                    swaps += mid - left
+                    right += 1
+                else:
+                    dst[pos] = src[left]
+                    left += 1
+                pos += 1
+            while left < mid:
+                dst[pos] = src[left]
+                left += 1
+                pos += 1
+            while right < end:
+                dst[pos] = src[right]
+                right += 1
+                pos += 1
+            start += 2 * width
+        src, dst = dst, src
+        width *= 2
+    
+    # 统计y中的并列对数(n2)
+    n2 = 0
+    i = 0
+    while i < n:
+        j = i + 1
+        while j < n and src[j] == src[i]:
+            j += 1
+        t = j - i
+        n2 += t * (t - 1) // 2
+        i = j
+    
+    # 带并列修正的tau-b
+    denominator = np.sqrt(float(n0 - n1) * float(n0 - n2))
+    if denominator == 0.0:
+        return np.nan
+    return (n0 - n1 - n2 + n3 - 2 * swaps) / denominator
+
+
+@njit(parallel=True, cache=True, nogil=True)
+def _basic_stats_batch(flat: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    """并行计算多组数据的基本统计量
+    
+    各组数据首尾相接存放在flat中，第g组为flat[offsets[g]:offsets[g + 1]]。
+    各组之间相互独立，使用prange并行计算。使用numba加速计算。
+    
+    Args:
+        flat: 所有组数据拼接后的数组
+        offsets: 各组的起止偏移，长度为组数+1
+        out: 预分配的结果数组，shape为(组数, 5)，
+            每行依次为最小值、最大值、平均值、中位数、标准差
+    """
+    num_groups = offsets.shape[0] - 1
+    for g in prange(num_groups):
+        segment = flat[offsets[g]:offsets[g + 1]]
+        n = segment.shape[0]
+        if n == 0:
+            out[g, :] = np.nan
+            continue
+        
+        # 单次遍历得到最小值、最大值和总和
+        vmin = segment[0]
+        vmax = segment[0]
+        total = 0.0
+        for i in range(n):
+            v = segment[i]
+            if v < vmin:
+                vmin = v
+            if v > vmax:
+                vmax = v
+            total += v
+        mean = total / n
+        
+        # 与np.std一致，使用总体标准差
+        sq_sum = 0.0
+        for i in range(n):
+            d = segment[i] - mean
+            sq_sum += d * d
+        
+        out[g, 0] = vmin
+        out[g, 1] = vmax
+        out[g, 2] = mean
+        out[g, 3] = np.median(segment)
+        out[g, 4] = np.sqrt(sq_sum / n)
+
+
+# 优先使用AOT预编译的内核（见_build_statistics_aot.py），不存在时回退到JIT版本
+try:
+    from data_processing.utils.statistics_aot import (
+        kendall_tau_b_sorted as _kendall_tau_b_sorted_impl
+    )
+except ImportError:
+    _kendall_tau_b_sorted_impl = _kendall_tau_b_sorted
 
 
 class StatisticsCalculator:
@@ -42,12 +214,50 @@ class StatisticsCalculator:
         return {
             "min": float(np.min(values)),
             "max": float(np.max(values)),
-            "mean": float(np.mean(values)),
-            "median": float(np.median(values)),
-            "std": float(np.std(values)),
-            "count": int(len(values))
+            "mean": np.mean(values).item(),
+            "median": np.median(values).item(),
+            "std": np.std(values).item(),
+            "count": len(values)
         }
     
+    @staticmethod
+    def calculate_basic_stats_grouped(groups: List[np.ndarray]) -> List[Dict[str, Any]]:
+        """批量计算多组数据的基本统计量
+        
+        将各组数据拼接后交给并行内核一次性计算，适用于按类别分组的大量数据。
+        
+        Args:
+            groups: 数据数组列表，每个数组为一组
+            
+        Returns:
+            List[Dict[str, Any]]: 各组的基本统计量字典，格式与calculate_basic_stats相同
+        """
+        if len(groups) == 0:
+            return []
+        
+        arrays = [np.asarray(group, dtype=np.float64).ravel() for group in groups]
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([len(arr) for arr in arrays], out=offsets[1:])
+        flat = np.concatenate(arrays)
+        out = np.empty((len(arrays), 5), dtype=np.float64)
+        _basic_stats_batch(flat, offsets, out)
+        
+        results = []
+        for g, arr in enumerate(arrays):
+            if len(arr) == 0:
+                results.append(StatisticsCalculator.calculate_basic_stats(arr))
+                continue
+            vmin, vmax, mean, median, std = out[g].tolist()
+            results.append({
+                "min": vmin,
+                "max": vmax,
+                "mean": mean,
+                "median": median,
+                "std": std,
+                "count": len(arr)
+            })
+        return results
+    
     @staticmethod
     def calculate_correlation(x: np.ndarray,
                             y: np.ndarray,
@@ -78,11 +288,19 @@ class StatisticsCalculator:
         
         # 计算相关系数
         if method == 'pearson':
-            return float(np.corrcoef(x, y)[0, 1])
+            return np.corrcoef(x, y)[0, 1].item()
         elif method == 'spearman':
-            return float(stats.spearmanr(x, y)[0])
+            return stats.spearmanr(x, y)[0].item()
         elif method == 'kendall':
-            return float(stats.kendalltau(x, y)[0])
+            if len(x) > _KENDALL_FAST_MIN_SIZE:
+                x_arr = np.asarray(x, dtype=np.float64)
+                y_arr = np.asarray(y, dtype=np.float64)
+                # 含nan或常数数组时交由scipy处理
+                if not (np.isnan(x_arr).any() or np.isnan(y_arr).any()):
+                    tau = _kendall_tau_b(x_arr, y_arr)
+                    if not np.isnan(tau):
+                        return tau
+            return stats.kendalltau(x, y)[0].item()
     
     @staticmethod
     def calculate_distribution(values: np.ndarray,
@@ -133,12 +351,12 @@ class StatisticsCalculator:
         
         # 计算百分位数
         for p in percentiles:
-            summary[f"p{int(p*100)}"] = float(np.percentile(values, p * 100))
+            summary[f"p{int(p*100)}"] = np.percentile(values, p * 100).item()
         
         # 计算偏度和峰度
         if len(values) > 2:
-            summary["skewness"] = float(stats.skew(values))
-            summary["kurtosis"] = float(stats.kurtosis(values))
+            summary["skewness"] = stats.skew(values).item()
+            summary["kurtosis"] = stats.kurtosis(values).item()
         
         return summary
     
@@ -190,7 +408,7 @@ class StatisticsCalculator:
             values: 数据数组
             
         Returns:
-            Dict[str, Any]: 箱线图统计量字典
+            Dict[str, Any]: 箱线图统计量字典，outliers为np.ndarray
         """
         # 处理空数组
         if len(values) == 0:
@@ -200,13 +418,13 @@ class StatisticsCalculator:
                 "median": None,
                 "q3": None,
                 "max": None,
-                "outliers": []
+                "outliers": np.array([])
             }
         
         # 计算四分位数
-        q1 = float(np.percentile(values, 25))
-        median = float(np.median(values))
-        q3 = float(np.percentile(values, 75))
+        q1 = np.percentile(values, 25).item()
+        median = np.median(values).item()
+        q3 = np.percentile(values, 75).item()
         
         # 计算IQR
         iqr = q3 - q1
@@ -216,7 +434,7 @@ class StatisticsCalculator:
         upper_bound = min(float(np.max(values)), q3 + 1.5 * iqr)
         
         # 查找异常值
-        outliers = values[(values < lower_bound) | (values > upper_bound)].tolist()
+        outliers = values[(values < lower_bound) | (values > upper_bound)]
         
         return {
             "min": lower_bound,
@@ -232,21 +450,22 @@ class StatisticsCalculator:
                                    bins: Optional[Union[int, List[float]]] = None) -> Dict[str, Any]:
         """计算分布统计量
         
-        计算数据分布的相关统计量。
+        计算数据分布的相关统计量。数组类结果直接以np.ndarray返回，
+        需要序列化时使用to_jsonable转换。
         
         Args:
             values: 数据数组
             bins: 分箱数或分箱边界列表
             
         Returns:
-            Dict[str, Any]: 分布统计量字典
+            Dict[str, Any]: 分布统计量字典，hist、bin_edges、bin_centers和fit.pdf为np.ndarray
         """
         # 处理空数组
         if len(values) == 0:
             return {
-                "hist": [],
-                "bin_edges": [],
-                "bin_centers": []
+                "hist": np.array([]),
+                "bin_edges": np.array([]),
+                "bin_centers": np.array([])
             }
         
         # 计算直方图
@@ -257,24 +476,26 @@ class StatisticsCalculator:
         
         # 添加正态分布拟合
         try:
-            mu, sigma = stats.norm.fit(values)
-            pdf = stats.norm.pdf(bin_centers, mu, sigma)
+            # 正态分布参数的极大似然估计即样本均值和总体标准差
+            mu = np.mean(values)
+            sigma = np.std(values)
+            pdf = np.exp(-0.5 * ((bin_centers - mu) / sigma) ** 2) / (sigma * _SQRT_2PI)
             fit_result = {
-                "mu": float(mu),
-                "sigma": float(sigma),
-                "pdf": pdf.tolist()
+                "mu": mu.item(),
+                "sigma": sigma.item(),
+                "pdf": pdf
             }
         except Exception:
             fit_result = {
                 "mu": None,
                 "sigma": None,
-                "pdf": []
+                "pdf": np.array([])
             }
         
         return {
-            "hist": hist.tolist(),
-            "bin_edges": bin_edges.tolist(),
-            "bin_centers": bin_centers.tolist(),
+            "hist": hist,
+            "bin_edges": bin_edges,
+            "bin_centers": bin_centers,
             "fit": fit_result
         }
     
@@ -307,21 +528,52 @@ class StatisticsCalculator:
                 }
             }
         
-        # 计算相关系数
+        # 计算相关系数：秩只计算一次，由spearman和kendall共用
         try:
-            pearson = StatisticsCalculator.calculate_correlation(x, y, 'pearson')
-            spearman = StatisticsCalculator.calculate_correlation(x, y, 'spearman')
-            kendall = StatisticsCalculator.calculate_correlation(x, y, 'kendall')
+            x = np.asarray(x, dtype=np.float64)
+            y = np.asarray(y, dtype=np.float64)
+            n = len(x)
+            
+            # 均值和离差平方和同时用于pearson和线性回归
+            mean_x = x.mean()
+            mean_y = y.mean()
+            dx = x - mean_x
+            dy = y - mean_y
+            ssx = dx @ dx
+            ssy = dy @ dy
+            sxy = dx @ dy
+            r = np.clip(sxy / np.sqrt(ssx * ssy), -1.0, 1.0).item()
+            
+            rx = stats.rankdata(x)
+            ry = stats.rankdata(y)
+            pearson = r
+            spearman = np.corrcoef(rx, ry)[0, 1].item()
+            # 含nan时秩全部为nan，与scipy保持一致返回nan
+            if np.isnan(rx).any() or np.isnan(ry).any():
+                kendall = np.nan
+            else:
+                kendall = _kendall_tau_b(rx, ry)
         except Exception:
             pearson = spearman = kendall = None
         
-        # 线性回归
+        # 线性回归：由上面的离差平方和直接推导，结果与stats.linregress一致
         try:
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+            if ssx == 0.0:
+                raise ValueError("x的值全部相同，无法进行线性回归")
+            slope = sxy / ssx
+            intercept = mean_y - slope * mean_x
+            if n == 2:
+                p_value = 1.0 if y[0] == y[1] else 0.0
+                std_err = 0.0
+            else:
+                df = n - 2
+                t = r * np.sqrt(df / ((1.0 - r + _TINY) * (1.0 + r + _TINY)))
+                p_value = 2.0 * special.stdtr(df, -abs(t))
+                std_err = np.sqrt((1 - r**2) * ssy / ssx / df)
             linear_fit = {
-                "slope": float(slope),
-                "intercept": float(intercept),
-                "r_value": float(r_value),
+                "slope": slope.item(),
+                "intercept": intercept.item(),
+                "r_value": r,
                 "p_value": float(p_value),
                 "std_err": float(std_err)
             }
@@ -371,7 +623,7 @@ class StatisticsCalculator:
         result = {}
         for p in percentages:
             try:
-                d = float(np.interp(p, x, y))
+                d = np.interp(p, x, y).item()
                 result[f"d{p}"] = d
             except Exception:
                 result[f"d{p}"] = np.nan
@@ -382,4 +634,27 @@ class StatisticsCalculator:
             if "d30" in result:
                 result["Cc"] = (result["d30"]**2) / (result["d10"] * result["d60"])  # 曲率系数
                 
-        return result 
\ No newline at end of file
+        return result
+    
+    @staticmethod
+    def to_jsonable(obj: Any) -> Any:
+        """转换为可序列化对象
+        
+        递归地将统计结果中的numpy数组和标量转换为Python原生类型，
+        仅在需要序列化（如JSON、YAML）时调用。
+        
+        Args:
+            obj: 统计结果，可以是字典、列表、数组或标量
+            
+        Returns:
+            Any: 只包含Python原生类型的对象
+        """
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, dict):
+            return {key: StatisticsCalculator.to_jsonable(value) for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [StatisticsCalculator.to_jsonable(value) for value in obj]
+        return obj
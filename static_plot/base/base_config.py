@@ -2,13 +2,108 @@
 配置管理模块，定义了绘图系统的配置类结构。包含StyleConfig（样式配置）、ElementConfig（元素配置）、BasePlotConfig（基础绘图配置）。提供了配置的验证、继承和模板机制。
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field, is_dataclass
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
-import seaborn as sns
+# 默认参数模板，各实例通过copy获得独立的副本
+_DEFAULT_FONT_PARAMS = MappingProxyType({
+    "family": "sans-serif",  # 使用无衬线字体族
+    "size": 6  # 6pt字号，适合图形尺寸
+})
 
+_DEFAULT_GRID_PARAMS = MappingProxyType({
+    "linestyle": "--",  # 虚线网格
+    "linewidth": 0.5,  # 细网格线
+    "alpha": 0.3,  # 较低透明度
+    "color": "black"  # 黑色网格
+})
 
-@dataclass
+# 字体列表使用元组，浅拷贝后各实例共享也不会被意外修改
+_DEFAULT_RC_PARAMS = MappingProxyType({
+    "font.sans-serif": ("Songti SC", "STHeiti", "LiHei Pro", "Arial"),  # 中文优先
+    "font.serif": ("Songti SC", "STSong", "SimSun", "Times New Roman"),  # 衬线字体
+    "axes.unicode_minus": False  # 使用 Unicode 负号
+})
+
+_DEFAULT_TICK_PARAMS = MappingProxyType({
+    "xticks": None,  # X轴刻度位置，None表示自动计算
+    "yticks": None,  # Y轴刻度位置，None表示自动计算
+    "xticklabels": None,  # X轴刻度标签，None表示使用刻度值
+    "yticklabels": None,  # Y轴刻度标签，None表示使用刻度值
+    "xlim": None,  # X轴范围，None表示自动计算
+    "ylim": None  # Y轴范围，None表示自动计算
+})
+
+_DEFAULT_OUTPUT_PARAMS = MappingProxyType({
+    "format": "pdf",  # 输出格式，默认PDF
+    "dpi": 300,  # 输出分辨率，适合印刷
+    "transparent": True,  # 透明背景
+    "bbox_inches": "tight",  # 裁剪空白区域
+    "path": None  # 输出路径，None表示需要手动指定
+})
+
+# 预设模板，键为点号分隔的配置路径；模板在各次调用间共享，使用只读映射
+_TEMPLATES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "paper": MappingProxyType({  # 论文模板
+        "style.figsize": (3.6, 2.7),  # 单栏宽度
+        "style.style": "white",  # 简洁白色背景
+        "style.context": "paper",  # 论文场景
+        "style.font_params.size": 8  # 论文字号
+    }),
+    "presentation": MappingProxyType({  # 演示模板
+        "style.figsize": (6.4, 4.8),  # 演示尺寸
+        "style.style": "whitegrid",  # 网格背景
+        "style.context": "talk",  # 演讲场景
+        "style.font_params.size": 12  # 演示字号
+    })
+})
+
+# 路径步骤类型：对象属性或字典键
+_ATTR = 0
+_ITEM = 1
+
+# 路径执行计划：(父对象取值步骤, 末级步骤类型, 末级键名)
+_PathPlan = Tuple[Tuple[Tuple[int, str], ...], int, str]
+
+# 已编译的配置路径缓存：(配置类, 键路径) -> 路径执行计划
+_PATH_CACHE: Dict[Tuple[type, str], _PathPlan] = {}
+
+
+def _compile_path(config_cls: type, key: str) -> _PathPlan:
+    """将点号分隔的键路径编译为路径执行计划
+    
+    沿路径遍历一次配置类的默认实例，记录每一级是对象属性还是字典键。
+    使用默认实例而非调用方的实例，个别实例被修改后的属性类型不会影响缓存的计划。
+    编译结果按(配置类, 键路径)缓存在_PATH_CACHE中。
+    
+    Args:
+        config_cls: 配置类，其默认实例用于确定各级节点的类型
+        key: 点号分隔的键路径，例如"style.font_params.size"
+    
+    Returns:
+        _PathPlan: (父对象取值步骤, 末级步骤类型, 末级键名)
+    """
+    cache_key = (config_cls, key)
+    plan = _PATH_CACHE.get(cache_key)
+    if plan is None:
+        *parents, leaf = key.split('.')
+        steps = []
+        obj = config_cls()
+        for part in parents:
+            if isinstance(obj, Mapping):
+                steps.append((_ITEM, part))
+                obj = obj[part]
+            else:
+                steps.append((_ATTR, part))
+                obj = getattr(obj, part)
+        plan = (tuple(steps), _ITEM if isinstance(obj, Mapping) else _ATTR, leaf)
+        _PATH_CACHE[cache_key] = plan
+    return plan
+
+
+@dataclass(slots=True)
 class StyleConfig:
     """样式配置类
     
@@ -58,10 +153,7 @@ class StyleConfig:
     dpi: int = 300  # 期刊常用分辨率
     
     # 字体设置
-    font_params: Dict[str, Any] = field(default_factory=lambda: {
-        "family": "sans-serif",  # 使用无衬线字体族
-        "size": 6  # 6pt字号，适合图形尺寸
-    })
+    font_params: Dict[str, Any] = field(default_factory=_DEFAULT_FONT_PARAMS.copy)  # 字体参数
     
     # 边框设置
     spine_width: float = 0.8  # 边框线宽，与其他元素协调
@@ -78,21 +170,98 @@ class StyleConfig:
     
     # 网格设置
     grid: bool = False  # 不显示网格，保持简洁
-    grid_params: Dict[str, Any] = field(default_factory=lambda: {
-        "linestyle": "--",  # 虚线网格
-        "linewidth": 0.5,  # 细网格线
-        "alpha": 0.3,  # 较低透明度
-        "color": "black"  # 黑色网格
-    })
+    grid_params: Dict[str, Any] = field(default_factory=_DEFAULT_GRID_PARAMS.copy)  # 网格参数
     
     # matplotlib 自定义RC参数
-    rc_params: Dict[str, Any] = field(default_factory=lambda: {
-        "font.sans-serif": ["Songti SC", "STHeiti", "LiHei Pro", "Arial"],  # 中文优先
-        "font.serif": ["Songti SC", "STSong", "SimSun", "Times New Roman"],  # 衬线字体
-        "axes.unicode_minus": False  # 使用 Unicode 负号
-    })
+    rc_params: Dict[str, Any] = field(default_factory=_DEFAULT_RC_PARAMS.copy)  # 自定义RC参数
+    
+    # RC参数缓存：(相关字段取值, RC参数字典)
+    _rc_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # 刻度参数缓存：(刻度字段取值, 主刻度参数, 次刻度参数)
+    _tick_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._tick_kwargs()
+    
+    @property
+    def major_tick_kwargs(self) -> Dict[str, Any]:
+        """主刻度的tick_params参数，返回的字典为缓存对象，不应修改"""
+        return self._tick_kwargs()[1]
+    
+    @property
+    def minor_tick_kwargs(self) -> Dict[str, Any]:
+        """次刻度的tick_params参数，返回的字典为缓存对象，不应修改"""
+        return self._tick_kwargs()[2]
+    
+    def _tick_kwargs(self) -> Tuple[Tuple[Any, ...], Dict[str, Any], Dict[str, Any]]:
+        """构建刻度参数，创建时构建一次，刻度相关字段的取值改变后重新构建
+        
+        缓存以字段取值为键，直接修改属性或通过update()修改都会生效。
+        """
+        values = (self.tick_direction, self.tick_width, self.tick_length, self.tick_color,
+                  self.minor_tick_width, self.minor_tick_length)
+        cache = self._tick_cache
+        if cache is None or cache[0] != values:
+            direction, width, length, color, minor_width, minor_length = values
+            major_kw = {
+                "direction": direction,
+                "width": width,
+                "length": length,
+                "color": color,
+                "top": False,
+                "right": False
+            }
+            minor_kw = {
+                **major_kw,
+                "width": minor_width,
+                "length": minor_length
+            }
+            cache = self._tick_cache = (values, major_kw, minor_kw)
+        return cache
+    
+    def to_rc_dict(self) -> Dict[str, Any]:
+        """获取边框、刻度样式及自定义参数对应的matplotlib RC参数
+        
+        结果以相关字段的取值为键缓存，字段取值改变后重新构建。返回的字典为缓存对象，不应修改。
+        字体参数由seaborn的set_theme设置，不包含在内；刻度颜色不包含在内，
+        因为xtick.color同时会改变刻度标签的颜色。
+        
+        Returns:
+            RC参数字典
+        
+        示例：
+            ```python
+            with plt.rc_context(config.style.to_rc_dict()):
+                fig, ax = plt.subplots()
+            ```
+        """
+        values = (self.spine_width, self.spine_color, self.tick_direction,
+                  self.tick_width, self.tick_length, self.minor_tick_width,
+                  self.minor_tick_length, tuple(self.rc_params.items()))
+        cache = self._rc_cache
+        if cache is not None and cache[0] == values:
+            return cache[1]
+        rc = {
+            "axes.linewidth": self.spine_width,
+            "axes.edgecolor": self.spine_color,
+            "xtick.top": False,
+            "ytick.right": False
+        }
+        for axis in ("xtick", "ytick"):
+            rc[f"{axis}.direction"] = self.tick_direction
+            rc[f"{axis}.major.width"] = self.tick_width
+            rc[f"{axis}.major.size"] = self.tick_length
+            rc[f"{axis}.minor.width"] = self.minor_tick_width
+            rc[f"{axis}.minor.size"] = self.minor_tick_length
+        rc.update(self.rc_params)
+        self._rc_cache = (values, rc)
+        return rc
 
-@dataclass
+@dataclass(slots=True)
 class ElementConfig:
     """元素配置类
     
@@ -138,17 +307,10 @@ class ElementConfig:
     title: Optional[str] = None  # 图形标题，默认不显示
     xlabel: Optional[str] = None  # X轴标签，默认不显示
     ylabel: Optional[str] = None  # Y轴标签，默认不显示
-    tick_params: Dict[str, Any] = field(default_factory=lambda: {
-        "xticks": None,  # X轴刻度位置，None表示自动计算
-        "yticks": None,  # Y轴刻度位置，None表示自动计算
-        "xticklabels": None,  # X轴刻度标签，None表示使用刻度值
-        "yticklabels": None,  # Y轴刻度标签，None表示使用刻度值
-        "xlim": None,  # X轴范围，None表示自动计算
-        "ylim": None  # Y轴范围，None表示自动计算
-    })
+    tick_params: Dict[str, Any] = field(default_factory=_DEFAULT_TICK_PARAMS.copy)  # 刻度参数
     annotations: List[Dict[str, Any]] = field(default_factory=list)  # 注释列表，默认为空
 
-@dataclass
+@dataclass(slots=True)
 class BasePlotConfig:
     """基础绘图配置类
     
@@ -166,6 +328,8 @@ class BasePlotConfig:
             - format: 输出格式，如'pdf', 'png'等
             - dpi: 输出分辨率
             - path: 输出路径
+        rasterize_threshold (Optional[int]): 数据点数超过该值的图层在保存时栅格化，
+            坐标轴和文本仍保持矢量，None表示不栅格化
     
     示例：
         ```python
@@ -184,22 +348,23 @@ class BasePlotConfig:
     """
     style: StyleConfig = field(default_factory=StyleConfig)  # 样式配置
     element: ElementConfig = field(default_factory=ElementConfig)  # 元素配置
-    output_params: Dict[str, Any] = field(default_factory=lambda: {
-        "format": "pdf",  # 输出格式，默认PDF
-        "dpi": 300,  # 输出分辨率，适合印刷
-        "transparent": True,  # 透明背景
-        "bbox_inches": "tight",  # 裁剪空白区域
-        "path": None  # 输出路径，None表示需要手动指定
-    })
+    output_params: Dict[str, Any] = field(default_factory=_DEFAULT_OUTPUT_PARAMS.copy)  # 输出参数
+    rasterize_threshold: Optional[int] = 5000  # 大数据量图层栅格化阈值
     
-    def update(self, config_dict: Dict[str, Any]) -> None:
+    def update(self, config_dict: Mapping[str, Any]) -> None:
         """更新配置参数
         
-        使用点号分隔的键路径更新嵌套配置。
+        使用点号分隔的键路径更新嵌套配置，路径中的每一级可以是配置对象的属性，
+        也可以是字典参数的键，路径指向的值被整体替换（字典值替换配置对象时，
+        未给出的字段使用默认值）。
+        
+        单级键的值为嵌套字典时按嵌套形式更新：目标为配置对象时逐个字段更新，
+        目标为字典参数时合并到原有参数中。
         
         Args:
             config_dict: 配置字典，键使用点号分隔表示路径
                 例如：{"style.font_params.size": 8}
+                或嵌套形式：{"style": {"font_params": {"size": 8}}}
         
         示例：
             ```python
@@ -208,14 +373,62 @@ class BasePlotConfig:
                 "element.title": "新标题",
                 "output_params.format": "png"
             })
+            
+            # 嵌套字典形式，rc_params只修改给出的键
+            config.update({"style": {"context": "talk", "rc_params": {"axes.linewidth": 1.0}}})
+            
+            # 点号键路径，rc_params被整体替换
+            config.update({"style.rc_params": {"axes.linewidth": 1.0}})
             ```
         """
         for key, value in config_dict.items():
-            parts = key.split('.')
+            if '.' not in key:
+                # 单级键直接设置属性，无需编译路径
+                self._apply_nested(self, key, value, key)
+                continue
+            steps, leaf_kind, leaf = _compile_path(type(self), key)
             obj = self
-            for part in parts[:-1]:
-                obj = getattr(obj, part)
-            setattr(obj, parts[-1], value)
+            for kind, name in steps:
+                obj = obj[name] if kind == _ITEM else getattr(obj, name)
+            if leaf_kind == _ITEM:
+                obj[leaf] = value
+            else:
+                if isinstance(value, Mapping) and is_dataclass(current := getattr(obj, leaf)):
+                    # 以字典整体替换配置对象
+                    value = type(current)(**value)
+                setattr(obj, leaf, value)
+            self._invalidate(key)
+    
+    def _apply_nested(self, obj: Any, name: str, value: Any, key: str) -> None:
+        """设置配置对象的单个属性
+        
+        值为字典且目标为配置对象时递归更新各字段，目标为字典参数时合并为新字典后整体替换。
+        
+        Args:
+            obj: 属性所在的配置对象
+            name: 属性名
+            value: 新值
+            key: 该属性对应的点号分隔键路径
+        """
+        if isinstance(value, Mapping):
+            current = getattr(obj, name)
+            if is_dataclass(current):
+                for sub_name, sub_value in value.items():
+                    self._apply_nested(current, sub_name, sub_value, f"{key}.{sub_name}")
+                return
+            if isinstance(current, Mapping):
+                value = {**current, **value}
+        setattr(obj, name, value)
+        self._invalidate(key)
+    
+    def _invalidate(self, key: str) -> None:
+        """配置项更新后的回调
+        
+        子类可重写该方法，清除依赖于该配置项的缓存。
+        
+        Args:
+            key: 被更新的点号分隔键路径
+        """
     
     @classmethod
     def create_template(cls, template_name: str) -> 'BasePlotConfig':
@@ -240,26 +453,8 @@ class BasePlotConfig:
             pres_config = BasePlotConfig.create_template("presentation")
             ```
         """
-        templates = {
-            "paper": {  # 论文模板
-                "style": {
-                    "figsize": (3.6, 2.7),  # 单栏宽度
-                    "style": "white",  # 简洁白色背景
-                    "context": "paper",  # 论文场景
-                    "font_params": {"size": 8}  # 论文字号
-                }
-            },
-            "presentation": {  # 演示模板
-                "style": {
-                    "figsize": (6.4, 4.8),  # 演示尺寸
-                    "style": "whitegrid",  # 网格背景
-                    "context": "talk",  # 演讲场景
-                    "font_params": {"size": 12}  # 演示字号
-                }
-            }
-        }
-        
         config = cls()
-        if template_name in templates:
-            config.update(templates[template_name])
+        template = _TEMPLATES.get(template_name)
+        if template is not None:
+            config.update(template)
         return config
@@ -8,16 +8,41 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.artist import ArtistInspector
+from matplotlib.collections import PathCollection
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
 
 from static_plot.base.base_config import BasePlotConfig
 from static_plot.base.base_style import BaseStyleManager
 from static_plot.base.validators import ConfigValidator
 
 
+def _text_annotation_keys() -> frozenset:
+    """获取可以通过ax.text绘制的注释参数名
+    
+    包括注释的text、xy、xytext、annotation_clip，以及Text对象的全部属性及其别名；
+    x、y和s由ax.text按位置传入，不能作为关键字参数。
+    """
+    inspector = ArtistInspector(Text)
+    keys = set(inspector.get_setters())
+    for aliases in inspector.aliasd.values():
+        keys.update(aliases)
+    keys -= {"x", "y", "s", "text"}
+    return frozenset(keys | {"fontdict", "text", "xy", "xytext", "annotation_clip"})
+
+
+# 只包含这些参数的注释直接用ax.text绘制，其余注释使用annotate
+_TEXT_ANNOTATION_KEYS = _text_annotation_keys()
+
+# 子图边距参数名，对应rcParams中的figure.subplot.*
+_SUBPLOT_PARAMS = ("left", "right", "bottom", "top", "wspace", "hspace")
+
+
 class BasePlotter(ABC):
     """基础绘图类
     
@@ -40,6 +65,7 @@ class BasePlotter(ABC):
         fig (Optional[plt.Figure]): matplotlib图形对象
         ax (Optional[plt.Axes]): matplotlib坐标轴对象
         style_manager (BaseStyleManager): 样式管理器对象
+        reuse_figure (bool): 多次绘图时是否复用同一个图形对象
     
     示例：
         ```python
@@ -59,13 +85,15 @@ class BasePlotter(ABC):
         ```
     """
     
-    def __init__(self, config: Optional[BasePlotConfig] = None):
+    def __init__(self, config: Optional[BasePlotConfig] = None, reuse_figure: bool = True):
         """初始化绘图器
         
         创建绘图器实例并进行必要的初始化工作。
         
         Args:
             config: 基础配置对象，如果为None则使用默认配置
+            reuse_figure: 是否复用图形对象，为True时多次调用plot()只清空
+                而不重新创建图形，默认为True
             
         Raises:
             ValueError: 当配置无效时抛出
@@ -83,27 +111,65 @@ class BasePlotter(ABC):
         self.config = config or BasePlotConfig()
         self.fig: Optional[plt.Figure] = None
         self.ax: Optional[plt.Axes] = None
-        self.style_manager = BaseStyleManager(self.config)
+        self.reuse_figure = reuse_figure
+        self._style_manager: Optional[BaseStyleManager] = None
         
         # 验证配置
         self.validate_config()
+        self._config_dirty = False
         
         # 设置基础环境
         self._setup_environment()
     
+    @property
+    def style_manager(self) -> BaseStyleManager:
+        """获取样式管理器
+        
+        首次使用时创建，配置对象被替换后重新创建。
+        
+        Returns:
+            与当前配置对应的样式管理器
+        """
+        manager = self._style_manager
+        if manager is None or manager.config is not self.config:
+            manager = self._style_manager = self._create_style_manager()
+        return manager
+    
+    def _create_style_manager(self) -> BaseStyleManager:
+        """创建样式管理器
+        
+        Returns:
+            样式管理器对象
+            
+        注意：
+            子类可以重写此方法以使用特定的样式管理器
+        """
+        return BaseStyleManager(self.config)
+    
     def validate_config(self) -> None:
         """验证配置有效性
         
-        检查配置参数是否满足要求。
+        检查配置参数是否满足要求，全部问题合并在一个异常中报告。
         
         Raises:
-            ValueError: 当配置参数无效时抛出
+            ValueError: 当配置参数无效时抛出，错误信息列出全部问题
         
         注意：
-            子类可以重写此方法以添加特定的验证逻辑
+            子类可以重写_collect_config_errors以添加特定的验证逻辑
+        """
+        ConfigValidator.raise_errors(self._collect_config_errors())
+    
+    def _collect_config_errors(self) -> List[str]:
+        """收集配置中的全部错误信息
+        
+        Returns:
+            错误信息列表，配置全部合法时返回空列表
+            
+        注意：
+            子类可以重写此方法，在基础配置的错误信息后追加特定配置的错误信息
         """
-        ConfigValidator.validate_style_config(self.config)
-        ConfigValidator.validate_element_config(self.config)
+        return (ConfigValidator.collect_style_errors(self.config)
+                + ConfigValidator.collect_element_errors(self.config))
     
     def validate_data(self, data: Dict[str, Any]) -> None:
         """验证数据有效性
@@ -148,10 +214,11 @@ class BasePlotter(ABC):
             data: 绘图数据字典
             
         Raises:
-            ValueError: 数据无效时抛出
+            ValueError: 配置被替换后验证失败时抛出
             RuntimeError: 绘图过程出错时抛出
         
         工作流程：
+        0. 验证被替换的配置
         1. 验证数据
         2. 创建图形
         3. 准备数据
@@ -169,6 +236,11 @@ class BasePlotter(ABC):
             plotter.plot(data)
             ```
         """
+        # 验证被替换的配置，多次替换只验证最终的配置
+        if self._config_dirty:
+            self.validate_config()
+            self._config_dirty = False
+        
         try:
             # 验证数据
             self.validate_data(data)
@@ -198,13 +270,22 @@ class BasePlotter(ABC):
     def create_figure(self) -> None:
         """创建图形并初始化
         
-        创建matplotlib图形和坐标轴对象。
+        创建matplotlib图形和坐标轴对象。启用复用时，若已有图形的尺寸和分辨率
+        与配置一致，则清空并复用该图形，避免重复创建Figure和画布对象。
         
         Raises:
             RuntimeError: 创建图形失败时抛出
         """
         try:
-            with sns.axes_style(self.config.style.style, rc=self.config.style.rc_params):
+            if self.fig is not None:
+                if self.reuse_figure and self._figure_matches():
+                    self.reset_figure()
+                    return
+                # 图形参数已变化，关闭旧图形后重新创建
+                self.close()
+            
+            with sns.axes_style(self.config.style.style, rc=self.config.style.rc_params), \
+                    plt.rc_context(self.style_manager.rc_dict()):
                 self.fig, self.ax = plt.subplots(
                     figsize=self.config.style.figsize,
                     dpi=self.config.style.dpi
@@ -212,6 +293,39 @@ class BasePlotter(ABC):
         except Exception as e:
             raise RuntimeError(f"创建图形失败: {str(e)}")
     
+    def _figure_matches(self) -> bool:
+        """检查已有图形是否与当前配置的尺寸和分辨率一致
+        
+        Returns:
+            bool: 是否可以直接复用
+        """
+        return (
+            tuple(self.fig.get_size_inches()) == tuple(self.config.style.figsize)
+            and self.fig.dpi == self.config.style.dpi
+        )
+    
+    def reset_figure(self) -> None:
+        """重置图形
+        
+        清空图形中的所有元素并重新创建坐标轴，保留Figure和画布对象以供复用。
+        
+        Raises:
+            ValueError: 图形不可用时抛出
+        """
+        if self.fig is None:
+            raise ValueError("没有可重置的图形")
+        
+        if self.ax is not None:
+            self.ax.cla()
+        self.fig.clf()
+        # 恢复默认的子图边距，清除上一次tight_layout的调整
+        self.fig.subplotpars.update(
+            **{key: plt.rcParams[f"figure.subplot.{key}"] for key in _SUBPLOT_PARAMS}
+        )
+        with sns.axes_style(self.config.style.style, rc=self.config.style.rc_params), \
+                plt.rc_context(self.style_manager.rc_dict()):
+            self.ax = self.fig.add_subplot(111)
+    
     @abstractmethod
     def prepare_data(self, data: Dict[str, Any]) -> None:
         """准备绘图数据
@@ -231,7 +345,9 @@ class BasePlotter(ABC):
         """实现具体绘图逻辑
         
         注意：
-            子类必须实现此方法以实现具体的绘图功能
+            - 子类必须实现此方法以实现具体的绘图功能
+            - 绘制的图层可通过set_rasterized(True)栅格化，数据点数超过
+              config.rasterize_threshold的Line2D和PathCollection会在保存时自动栅格化
         """
         pass
     
@@ -247,8 +363,8 @@ class BasePlotter(ABC):
             return
             
         try:
-            # 1. 应用基础样式
-            self.style_manager.apply_style(self.ax)
+            # 1. 应用基础样式（坐标轴已在rc_dict()的RC参数下创建）
+            self.style_manager.apply_style(self.ax, rc_applied=True)
             
             # 2. 应用特定样式
             self.apply_specific_style()
@@ -319,19 +435,48 @@ class BasePlotter(ABC):
     def _add_annotations(self) -> None:
         """添加注释
         
-        添加自定义注释。
+        添加自定义注释。只包含ax.text支持参数的纯文本注释直接通过ax.text绘制，
+        省去annotate的坐标系解析和箭头对象开销；其余注释（箭头、坐标系等）仍使用annotate。
+        
+        annotate默认不绘制xy位于坐标轴范围之外的注释，ax.text则总会绘制，
+        因此只有xy位于当前坐标轴范围内或设置annotation_clip=False的注释使用ax.text，
+        其余注释交给annotate按其规则决定是否绘制。
         """
+        ax = self.ax
+        limits = None
         for annotation in self.config.element.annotations:
-            self.ax.annotate(**annotation)
+            if _TEXT_ANNOTATION_KEYS.issuperset(annotation):
+                params = dict(annotation)
+                clip = params.pop("annotation_clip", None)
+                xy = params["xy"]
+                if clip is not False:
+                    if limits is None:
+                        limits = (sorted(ax.get_xlim()), sorted(ax.get_ylim()))
+                    (x0, x1), (y0, y1) = limits
+                    if not (x0 <= xy[0] <= x1 and y0 <= xy[1] <= y1):
+                        ax.annotate(**annotation)
+                        continue
+                text = params.pop("text")
+                del params["xy"]
+                xytext = params.pop("xytext", None)
+                x, y = xy if xytext is None else xytext
+                ax.text(x, y, text, **params)
+            else:
+                ax.annotate(**annotation)
     
     def adjust_layout(self) -> None:
         """调整图表布局
         
-        优化图表的整体布局。
+        优化图表的整体布局。没有标题、轴标签和注释时默认的坐标轴位置已经合适，
+        跳过开销较大的tight_layout。
         
         Raises:
             RuntimeError: 布局调整失败时抛出
         """
+        element = self.config.element
+        if not (element.title or element.xlabel or element.ylabel or element.annotations):
+            return
+        
         if self.fig is not None:
             try:
                 self.fig.tight_layout()
@@ -363,20 +508,47 @@ class BasePlotter(ABC):
             raise ValueError("没有可保存的图形")
         
         try:
-            save_path = Path(path) if path else self.config.output_params["path"]
+            save_path = path or self.config.output_params["path"]
             if save_path is None:
                 raise ValueError("未指定输出路径")
+            save_path = Path(save_path)
             
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
-            self.config.output_params.pop("path")
+            self._rasterize_heavy_layers()
+            
+            # path不是savefig的参数，其余输出参数（包括dpi）直接传递
+            save_params = {
+                key: value for key, value in self.config.output_params.items()
+                if key != "path"
+            }
             self.fig.savefig(
                 save_path,
-                **self.config.output_params
+                **save_params
             )
         except Exception as e:
             raise RuntimeError(f"保存图形失败: {str(e)}")
     
+    def _rasterize_heavy_layers(self) -> None:
+        """栅格化大数据量图层
+        
+        将数据点数超过阈值的折线和散点图层栅格化，坐标轴和文本保持矢量输出，
+        以减小矢量格式（如PDF）的文件体积和写入时间。栅格分辨率由output_params中的dpi决定。
+        """
+        threshold = self.config.rasterize_threshold
+        if threshold is None or self.ax is None:
+            return
+        
+        for artist in self.ax.get_children():
+            if isinstance(artist, PathCollection):
+                num_points = artist.get_offsets().shape[0]
+            elif isinstance(artist, Line2D):
+                num_points = len(artist.get_xdata())
+            else:
+                continue
+            if num_points > threshold:
+                artist.set_rasterized(True)
+    
     def show(self) -> None:
         """显示图像
         
@@ -402,7 +574,7 @@ class BasePlotter(ABC):
     def cleanup(self) -> None:
         """清理所有资源
         
-        关闭所有打开的图形并释放资源。
+        关闭所有打开的图形并释放资源。复用模式下的图形也会在此真正关闭。
         """
         self.close()
         plt.close('all')
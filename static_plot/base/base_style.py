@@ -3,10 +3,15 @@
 支持样式的继承和扩展。样式系统采用分层设计，包括基础样式、特定样式和自定义样式三个层次。
 """
 
-import matplotlib.pyplot as plt
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
 
 from static_plot.base.base_config import BasePlotConfig
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 
 class BaseStyleManager:
     """基础样式管理器类
@@ -53,17 +58,39 @@ class BaseStyleManager:
         """
         self.config = config
     
-    def apply_style(self, ax: plt.Axes) -> None:
+    def rc_dict(self) -> Dict[str, Any]:
+        """获取边框和刻度样式对应的matplotlib RC参数
+        
+        在plt.rc_context中创建坐标轴时，边框和刻度直接以这些参数创建，
+        无需再逐个设置边框样式。刻度颜色不包含在内，由apply_ticks单独设置。
+        参数由StyleConfig.to_rc_dict()构建并缓存。
+        
+        Returns:
+            RC参数字典
+        
+        示例：
+            ```python
+            with plt.rc_context(style_manager.rc_dict()):
+                fig, ax = plt.subplots()
+            style_manager.apply_style(ax, rc_applied=True)
+            ```
+        """
+        return self.config.style.to_rc_dict()
+    
+    def apply_style(self, ax: plt.Axes, rc_applied: bool = False) -> None:
         """应用基础样式
         
         为指定的坐标轴对象应用基础样式设置。
         
         Args:
             ax: matplotlib坐标轴对象
+            rc_applied: 坐标轴是否已在rc_dict()的RC参数下创建，
+                是则跳过边框设置
             
         注意：
             - 样式应用顺序：边框 -> 刻度 -> 网格
             - 确保坐标轴对象可用
+            - 刻度始终需要设置：离开rc_context后新创建的刻度会使用全局RC参数
         
         示例：
             ```python
@@ -74,7 +101,8 @@ class BaseStyleManager:
         if ax is None:
             return
             
-        self.apply_spines(ax)
+        if not rc_applied:
+            self.apply_spines(ax)
         self.apply_ticks(ax)
         self.apply_grid(ax)
     
@@ -87,11 +115,11 @@ class BaseStyleManager:
             ax: matplotlib坐标轴对象
             
         注意：
-            应用于所有可见的边框
+            - 应用于所有可见的边框
+            - 通过ax.spines[:]一次设置全部边框
         """
-        for spine in ax.spines.values():
-            spine.set_linewidth(self.config.style.spine_width)
-            spine.set_color(self.config.style.spine_color)
+        style = self.config.style
+        ax.spines[:].set(linewidth=style.spine_width, color=style.spine_color)
     
     def apply_ticks(self, ax: plt.Axes) -> None:
         """设置刻度样式
@@ -105,29 +133,15 @@ class BaseStyleManager:
             - 主刻度和次刻度使用不同的参数
             - 可以通过配置控制次刻度的显示
         """
+        style = self.config.style
+        
         # 设置主刻度
-        ax.tick_params(
-            which="major",
-            direction=self.config.style.tick_direction,
-            width=self.config.style.tick_width,
-            length=self.config.style.tick_length,
-            color=self.config.style.tick_color,
-            top=False,
-            right=False
-        )
+        ax.tick_params(which="major", **style.major_tick_kwargs)
         
         # 设置次刻度
-        if self.config.style.minor_ticks:
+        if style.minor_ticks:
             ax.minorticks_on()
-            ax.tick_params(
-                which="minor",
-                direction=self.config.style.tick_direction,
-                width=self.config.style.minor_tick_width,
-                length=self.config.style.minor_tick_length,
-                color=self.config.style.tick_color,
-                top=False,
-                right=False
-            )
+            ax.tick_params(which="minor", **style.minor_tick_kwargs)
     
     def apply_grid(self, ax: plt.Axes) -> None:
         """设置网格样式
@@ -4,13 +4,75 @@
 ValueError异常并提供详细的错误信息。
 """
 
-from typing import Any, Dict
-
-import numpy as np
+from math import inf
+from numbers import Real
+from typing import Any, Callable, Dict, List, Tuple
 
 from static_plot.base.base_config import BasePlotConfig
 from static_plot.box_plot.box_config import BoxPlotConfig
 
+# 字典键缺失的标记，用于一次get同时判断键是否存在并取值
+_MISSING = object()
+
+# 数值范围检查表：(属性路径, 下界, 上界, 错误信息)，要求 下界 < 值 <= 上界，
+# 按表中顺序检查，报告第一个不满足的参数
+_STYLE_RANGE_CHECKS = (
+    ("style.spine_width", 0, inf, "边框线宽必须为正数"),
+    ("style.tick_width", 0, inf, "刻度线宽必须为正数"),
+    ("style.tick_length", 0, inf, "刻度长度必须为正数"),
+)
+
+_BOX_RANGE_CHECKS = (
+    ("box_params.width", 0, 1, "箱体宽度必须在0到1之间"),
+    ("box_params.alpha", 0, 1, "箱体透明度必须在0到1之间"),
+    ("box_params.linewidth", 0, inf, "箱体线宽必须为正数"),
+    ("outlier_params.size", 0, inf, "离群点大小必须为正数"),
+    ("outlier_params.alpha", 0, 1, "离群点透明度必须在0到1之间"),
+    ("group_params.size", 0, inf, "分组大小必须为正数"),
+    ("group_params.divider.alpha", 0, 1, "分隔线透明度必须在0到1之间"),
+    ("group_params.divider.width", 0, inf, "分隔线宽度必须为正数"),
+)
+
+
+def _compile_range_checks(checks: Tuple[Tuple[str, float, float, str], ...]) -> Callable[[Any], List[str]]:
+    """将数值范围检查表编译为检查函数
+    
+    生成逐项展开的函数源码并执行，同一对象上的参数只读取一次该对象，
+    调用时无需循环和逐级解析属性路径。
+    
+    Args:
+        checks: 数值范围检查表
+        
+    Returns:
+        检查函数，返回全部超出范围的参数对应的错误信息列表，全部合法时返回空列表
+    """
+    lines = ["def check(config):", "    errors = []"]
+    namespace: Dict[str, Any] = {}
+    owners: Dict[str, str] = {}
+    for i, (path, low, high, message) in enumerate(checks):
+        owner, _, name = path.rpartition(".")
+        if owner not in owners:
+            owners[owner] = f"obj{len(owners)}"
+            lines.append(f"    {owners[owner]} = config.{owner}")
+        condition = f"value <= {low!r}" if high == inf else f"value <= {low!r} or value > {high!r}"
+        lines.append(f"    value = {owners[owner]}.{name}")
+        lines.append(f"    if {condition}:")
+        lines.append(f"        errors.append(message{i})")
+        namespace[f"message{i}"] = message
+    lines.append("    return errors")
+    exec("\n".join(lines), namespace)
+    return namespace["check"]
+
+
+_check_style_ranges = _compile_range_checks(_STYLE_RANGE_CHECKS)
+_check_box_ranges = _compile_range_checks(_BOX_RANGE_CHECKS)
+
+
+def _raise_errors(errors: List[str]) -> None:
+    """将收集到的全部错误信息合并为一个ValueError抛出，没有错误时直接返回"""
+    if errors:
+        raise ValueError("；".join(errors))
+
 
 class ConfigValidator:
     """配置验证器类
@@ -22,7 +84,8 @@ class ConfigValidator:
     
     所有方法都是静态方法，可以直接调用。
     
-    验证失败时会抛出ValueError异常，并给出详细的错误信息。
+    验证失败时会抛出ValueError异常，错误信息列出全部问题，以分号分隔。
+    collect_*_errors方法只收集错误信息而不抛出异常，用于合并多项验证的结果后一次报告。
     
     示例：
         ```python
@@ -34,9 +97,26 @@ class ConfigValidator:
             ConfigValidator.validate_box_config(config)
         except ValueError as e:
             print(f"配置无效: {str(e)}")
+        
+        # 合并多项验证的结果，一次报告全部问题
+        errors = (ConfigValidator.collect_style_errors(config)
+                  + ConfigValidator.collect_box_errors(config))
+        ConfigValidator.raise_errors(errors)
         ```
     """
     
+    @staticmethod
+    def raise_errors(errors: List[str]) -> None:
+        """将错误信息列表合并为一个ValueError抛出
+        
+        Args:
+            errors: 错误信息列表，为空时直接返回
+            
+        Raises:
+            ValueError: 错误信息列表不为空时抛出，错误信息以分号分隔
+        """
+        _raise_errors(errors)
+    
     @staticmethod
     def validate_style_config(config: BasePlotConfig) -> None:
         """验证样式配置的有效性
@@ -51,7 +131,7 @@ class ConfigValidator:
             config: 基础配置对象
             
         Raises:
-            ValueError: 当配置参数无效时抛出，错误信息会指明具体问题
+            ValueError: 当配置参数无效时抛出，错误信息列出全部问题
         
         示例：
             ```python
@@ -62,31 +142,50 @@ class ConfigValidator:
                 print(f"样式配置无效: {str(e)}")
             ```
         """
-        # 验证图形尺寸
-        if not isinstance(config.style.figsize, tuple) or len(config.style.figsize) != 2:
-            raise ValueError("图形尺寸必须是包含两个元素的元组")
-        if config.style.figsize[0] <= 0 or config.style.figsize[1] <= 0:
-            raise ValueError("图形尺寸必须为正数")
+        _raise_errors(ConfigValidator.collect_style_errors(config))
+    
+    @staticmethod
+    def collect_style_errors(config: BasePlotConfig) -> List[str]:
+        """收集样式配置中的全部错误信息，检查项同validate_style_config
+        
+        Args:
+            config: 基础配置对象
+            
+        Returns:
+            错误信息列表，配置全部合法时返回空列表
+        """
+        style = config.style
+        errors = []
+        
+        # 验证图形尺寸：字符串、字典等可迭代对象也能解包为两个元素，需检查元素类型
+        try:
+            width, height = style.figsize
+            if not (isinstance(width, Real) and isinstance(height, Real)):
+                raise TypeError
+        except (TypeError, ValueError):
+            errors.append("图形尺寸必须是包含两个数值的序列")
+        else:
+            if width <= 0 or height <= 0:
+                errors.append("图形尺寸必须为正数")
             
         # 验证DPI
-        if config.style.dpi <= 0:
-            raise ValueError("DPI必须为正数")
+        if style.dpi <= 0:
+            errors.append("DPI必须为正数")
             
         # 验证字体参数
-        if not isinstance(config.style.font_params, dict):
-            raise ValueError("字体参数必须是字典类型")
-        if "family" not in config.style.font_params or "size" not in config.style.font_params:
-            raise ValueError("字体参数必须包含'family'和'size'")
-        if config.style.font_params["size"] <= 0:
-            raise ValueError("字体大小必须为正数")
+        font_params = style.font_params
+        if not isinstance(font_params, dict):
+            errors.append("字体参数必须是字典类型")
+        else:
+            font_size = font_params.get("size", _MISSING)
+            if font_size is _MISSING or "family" not in font_params:
+                errors.append("字体参数必须包含'family'和'size'")
+            elif font_size <= 0:
+                errors.append("字体大小必须为正数")
             
         # 验证线条参数
-        if config.style.spine_width <= 0:
-            raise ValueError("边框线宽必须为正数")
-        if config.style.tick_width <= 0:
-            raise ValueError("刻度线宽必须为正数")
-        if config.style.tick_length <= 0:
-            raise ValueError("刻度长度必须为正数")
+        errors += _check_style_ranges(config)
+        return errors
     
     @staticmethod
     def validate_element_config(config: BasePlotConfig) -> None:
@@ -100,7 +199,7 @@ class ConfigValidator:
             config: 基础配置对象
             
         Raises:
-            ValueError: 当配置参数无效时抛出，错误信息会指明具体问题
+            ValueError: 当配置参数无效时抛出，错误信息列出全部问题
         
         示例：
             ```python
@@ -111,17 +210,39 @@ class ConfigValidator:
                 print(f"元素配置无效: {str(e)}")
             ```
         """
+        _raise_errors(ConfigValidator.collect_element_errors(config))
+    
+    @staticmethod
+    def collect_element_errors(config: BasePlotConfig) -> List[str]:
+        """收集元素配置中的全部错误信息，检查项同validate_element_config
+        
+        Args:
+            config: 基础配置对象
+            
+        Returns:
+            错误信息列表，配置全部合法时返回空列表
+        """
+        element = config.element
+        errors = []
+        
         # 验证刻度参数
-        tick_params = config.element.tick_params
-        if not isinstance(tick_params, dict):
-            raise ValueError("刻度参数必须是字典类型")
+        if not isinstance(element.tick_params, dict):
+            errors.append("刻度参数必须是字典类型")
             
-        # 验证注释参数
-        for annotation in config.element.annotations:
-            if not isinstance(annotation, dict):
-                raise ValueError("注释必须是字典类型")
-            if "text" not in annotation:
-                raise ValueError("注释必须包含'text'字段")
+        # 验证注释参数：全部合法时只遍历一次，出错时再定位不合法注释的索引，
+        # 类型错误的注释不再检查字段
+        annotations = element.annotations
+        if not all(isinstance(annotation, dict) and "text" in annotation for annotation in annotations):
+            not_dict = [i for i, annotation in enumerate(annotations) if not isinstance(annotation, dict)]
+            no_text = [
+                i for i, annotation in enumerate(annotations)
+                if isinstance(annotation, dict) and "text" not in annotation
+            ]
+            if not_dict:
+                errors.append(f"注释必须是字典类型（索引{not_dict}）")
+            if no_text:
+                errors.append(f"注释必须包含'text'字段（索引{no_text}）")
+        return errors
     
     @staticmethod
     def validate_box_config(config: BoxPlotConfig) -> None:
@@ -136,7 +257,7 @@ class ConfigValidator:
             config: 箱型图配置对象
             
         Raises:
-            ValueError: 当配置参数无效时抛出，错误信息会指明具体问题
+            ValueError: 当配置参数无效时抛出，错误信息列出全部问题
         
         示例：
             ```python
@@ -147,27 +268,20 @@ class ConfigValidator:
                 print(f"箱型图配置无效: {str(e)}")
             ```
         """
-        # 验证箱体参数
-        if config.box_params["width"] <= 0 or config.box_params["width"] > 1:
-            raise ValueError("箱体宽度必须在0到1之间")
-        if config.box_params["alpha"] <= 0 or config.box_params["alpha"] > 1:
-            raise ValueError("箱体透明度必须在0到1之间")
-        if config.box_params["linewidth"] <= 0:
-            raise ValueError("箱体线宽必须为正数")
-            
-        # 验证离群点参数
-        if config.outlier_params["size"] <= 0:
-            raise ValueError("离群点大小必须为正数")
-        if config.outlier_params["alpha"] <= 0 or config.outlier_params["alpha"] > 1:
-            raise ValueError("离群点透明度必须在0到1之间")
+        _raise_errors(ConfigValidator.collect_box_errors(config))
+    
+    @staticmethod
+    def collect_box_errors(config: BoxPlotConfig) -> List[str]:
+        """收集箱型图配置中的全部错误信息，检查项同validate_box_config
+        
+        Args:
+            config: 箱型图配置对象
             
-        # 验证分组参数
-        if config.group_params["size"] <= 0:
-            raise ValueError("分组大小必须为正数")
-        if config.group_params["divider"]["alpha"] <= 0 or config.group_params["divider"]["alpha"] > 1:
-            raise ValueError("分隔线透明度必须在0到1之间")
-        if config.group_params["divider"]["width"] <= 0:
-            raise ValueError("分隔线宽度必须为正数")
+        Returns:
+            错误信息列表，配置全部合法时返回空列表
+        """
+        # 验证箱体、离群点和分组参数
+        return _check_box_ranges(config)
 
 
 class DataValidator:
@@ -240,24 +354,46 @@ class DataValidator:
         # 验证数据结构
         if not isinstance(data, dict):
             raise ValueError("数据必须是字典类型")
-        if "data" not in data or "metadata" not in data:
+        content = data.get("data", _MISSING)
+        metadata = data.get("metadata", _MISSING)
+        if content is _MISSING or metadata is _MISSING:
             raise ValueError("数据必须包含'data'和'metadata'字段")
             
         # 验证数据内容
-        if "values" not in data["data"]:
+        if "values" not in content:
             raise ValueError("数据必须包含'values'字段")
-        if not isinstance(data["data"]["values"], dict):
+        values = content["values"]
+        if not isinstance(values, dict):
             raise ValueError("values必须是字典类型")
             
-        # 验证数据有效性
-        for key, value in data["data"]["values"].items():
-            if not isinstance(value, (list, np.ndarray)):
+        # 延迟导入numpy，只验证配置时无需加载
+        import numpy as np
+        
+        # 验证数据有效性：通常全部数据为同一类型，按第一个值的类型一次遍历同时检查类型和非空
+        value_type = type(next(iter(values.values()), None))
+        if value_type is list:
+            valid = all(type(value) is list and value for value in values.values())
+        elif value_type is np.ndarray:
+            # numpy数组直接读取元素总数，多维数组的任一维度为0都视为空
+            valid = all(type(value) is np.ndarray and value.size for value in values.values())
+        else:
+            valid = False
+        
+        if not valid:
+            # 类型混合或存在无效数据：先检查全部数据的类型，再一次性检查长度，出错时再定位具体的键
+            sequence_types = (list, np.ndarray)
+            if not all(isinstance(value, sequence_types) for value in values.values()):
+                key = next(k for k, v in values.items() if not isinstance(v, sequence_types))
                 raise ValueError(f"'{key}'的值必须是列表或numpy数组")
-            if len(value) == 0:
+            lengths = np.fromiter(
+                (value.size if type(value) is np.ndarray else len(value) for value in values.values()),
+                dtype=np.intp, count=len(values)
+            )
+            if not lengths.all():
+                key = next(k for k, v in zip(values, lengths) if v == 0)
                 raise ValueError(f"'{key}'的数据不能为空")
             
         # 验证元数据
-        metadata = data["metadata"]
         if not isinstance(metadata, dict):
             raise ValueError("元数据必须是字典类型")
         if "x_label" not in metadata or "y_label" not in metadata:
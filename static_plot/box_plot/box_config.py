@@ -3,14 +3,154 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
-
-import seaborn as sns
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from static_plot.base.base_config import BasePlotConfig
 
 
-@dataclass
+@dataclass(slots=True)
+class BoxParams:
+    """箱体参数
+    
+    属性说明：
+        width (float): 箱体宽度，范围(0,1]
+        alpha (float): 箱体透明度，范围[0,1]
+        linewidth (float): 箱体线宽
+        notch (bool): 是否显示凹槽
+        showfliers (bool): 是否显示离群点
+    """
+    width: float = 0.4  # 箱体宽度，适中值
+    alpha: float = 1.0  # 不透明
+    linewidth: float = 0.8  # 线宽，与其他元素协调
+    notch: bool = False  # 不使用凹槽
+    showfliers: bool = True  # 显示离群点
+
+
+@dataclass(slots=True)
+class WhiskerParams:
+    """须线参数
+    
+    属性说明：
+        linewidth (float): 线宽
+        style (str): 线型，如'-', '--'等
+    """
+    linewidth: float = 0.8  # 线宽，与箱体一致
+    style: str = "-"  # 实线样式
+
+
+@dataclass(slots=True)
+class MedianParams:
+    """中位线参数
+    
+    属性说明：
+        color (str): 线条颜色
+        linewidth (float): 线宽
+    """
+    color: str = "black"  # 黑色中位线
+    linewidth: float = 0.8  # 线宽，与箱体一致
+
+
+@dataclass(slots=True)
+class OutlierParams:
+    """离群点参数
+    
+    属性说明：
+        marker (str): 标记样式，如'o', 'D'等
+        size (float): 标记大小
+        alpha (float): 透明度
+        color (Optional[str]): 颜色，None表示使用箱体颜色
+    """
+    marker: str = "o"  # 圆形标记
+    size: float = 2  # 较小的标记尺寸
+    alpha: float = 0.6  # 适中的透明度
+    color: Optional[str] = None  # 使用箱体颜色
+
+
+@dataclass(slots=True)
+class DividerParams:
+    """分组分隔线参数
+    
+    属性说明：
+        show (bool): 是否显示分隔线
+        style (str): 线型
+        color (str): 颜色
+        alpha (float): 透明度
+        width (float): 线宽
+    """
+    show: bool = True  # 显示分隔线
+    style: str = "-"  # 实线样式
+    color: str = "black"  # 黑色
+    alpha: float = 0.8  # 较高的不透明度
+    width: float = 0.6  # 较细的线宽
+
+
+@dataclass(slots=True)
+class GroupParams:
+    """分组参数
+    
+    属性说明：
+        size (int): 每组的箱子数量
+        divider (DividerParams): 分组分隔线的样式设置，也可传入字典
+    """
+    size: int = 4  # 每组4个箱子
+    divider: DividerParams = field(default_factory=DividerParams)  # 分隔线样式
+    
+    def __post_init__(self):
+        if isinstance(self.divider, dict):
+            self.divider = DividerParams(**self.divider)
+
+
+# 各参数字段对应的参数类型，传入字典时据此转换
+_PARAM_TYPES = {
+    "box_params": BoxParams,
+    "whisker_params": WhiskerParams,
+    "median_params": MedianParams,
+    "outlier_params": OutlierParams,
+    "group_params": GroupParams
+}
+
+# 调色板缓存的代数，清除缓存时递增，使各配置实例的颜色缓存一并失效
+_palette_generation = 0
+
+
+@lru_cache(maxsize=16)
+def _base_palette(group_size: int, palette_name: Optional[str] = None) -> Tuple[Any, ...]:
+    """获取每组箱子使用的基础颜色
+    
+    调色板构造开销较大，结果按(group_size, palette_name)缓存，各配置实例共享。
+    
+    Args:
+        group_size: 每组的箱子数量
+        palette_name: seaborn调色板名称，None表示当前默认调色板
+    
+    Returns:
+        Tuple[Any, ...]: 基础颜色元组
+    """
+    # 延迟导入seaborn，避免导入配置模块时加载pandas、scipy等依赖
+    import seaborn as sns
+    # 使用n_colors直接生成所需数量的颜色，组内箱子数超过调色板长度时循环使用
+    return tuple(sns.color_palette(palette_name, n_colors=group_size))
+
+
+def clear_palette_cache() -> None:
+    """清除调色板缓存
+    
+    通过sns.set_palette()等方式修改默认调色板后调用，下次获取颜色时重新读取调色板。
+    
+    示例：
+        ```python
+        sns.set_palette("Set2")
+        clear_palette_cache()
+        colors = config.get_colors(8)  # 使用新的调色板
+        ```
+    """
+    global _palette_generation
+    _base_palette.cache_clear()
+    _palette_generation += 1
+
+
+@dataclass(slots=True)
 class BoxPlotConfig(BasePlotConfig):
     """箱型图配置类
     
@@ -22,30 +162,33 @@ class BoxPlotConfig(BasePlotConfig):
     - 分组参数：控制多组箱型图的布局
     
     属性说明：
-        box_params (Dict[str, Any]): 箱体参数配置，包括：
+        box_params (BoxParams): 箱体参数配置，包括：
             - width: 箱体宽度，范围(0,1]
             - alpha: 箱体透明度，范围[0,1]
             - linewidth: 箱体线宽
             - notch: 是否显示凹槽
             - showfliers: 是否显示离群点
         
-        whisker_params (Dict[str, Any]): 须线参数配置，包括：
+        whisker_params (WhiskerParams): 须线参数配置，包括：
             - linewidth: 线宽
             - style: 线型，如'-', '--'等
         
-        median_params (Dict[str, Any]): 中位线参数配置，包括：
+        median_params (MedianParams): 中位线参数配置，包括：
             - color: 线条颜色
             - linewidth: 线宽
         
-        outlier_params (Dict[str, Any]): 离群点参数配置，包括：
+        outlier_params (OutlierParams): 离群点参数配置，包括：
             - marker: 标记样式，如'o', 'D'等
             - size: 标记大小
             - alpha: 透明度
             - color: 颜色，None表示使用箱体颜色
         
-        group_params (Dict[str, Any]): 分组参数配置，包括：
+        group_params (GroupParams): 分组参数配置，包括：
             - size: 每组的箱子数量
             - divider: 分组分隔线的样式设置
+        
+        初始化时各参数也可以传入字典，会自动转换为对应的参数类型，未给出的字段使用默认值；
+        通过update()传入字典时只更新给出的字段。
     
     示例：
         ```python
@@ -58,48 +201,47 @@ class BoxPlotConfig(BasePlotConfig):
             outlier_params={"marker": "x", "size": 4},
             group_params={"size": 3}
         )
+        
+        # 修改单个参数
+        custom_config.update({"box_params.width": 0.6})
+        
+        # 修改多个参数
+        custom_config.update({"box_params": {"width": 0.6, "alpha": 0.8}})
         ```
     """
-    box_params: Dict[str, Any] = field(default_factory=lambda: {
-        "width": 0.4,  # 箱体宽度，适中值
-        "alpha": 1.0,  # 不透明
-        "linewidth": 0.8,  # 线宽，与其他元素协调
-        "notch": False,  # 不使用凹槽
-        "showfliers": True  # 显示离群点
-    })
-    
-    whisker_params: Dict[str, Any] = field(default_factory=lambda: {
-        "linewidth": 0.8,  # 线宽，与箱体一致
-        "style": "-"  # 实线样式
-    })
-    
-    median_params: Dict[str, Any] = field(default_factory=lambda: {
-        "color": "black",  # 黑色中位线
-        "linewidth": 0.8  # 线宽，与箱体一致
-    })
-    
-    outlier_params: Dict[str, Any] = field(default_factory=lambda: {
-        "marker": "o",  # 圆形标记
-        "size": 2,  # 较小的标记尺寸
-        "alpha": 0.6,  # 适中的透明度
-        "color": None  # 使用箱体颜色
-    })
-    
-    group_params: Dict[str, Any] = field(default_factory=lambda: {
-        "size": 4,  # 每组4个箱子
-        "divider": {
-            "show": True,  # 显示分隔线
-            "style": "-",  # 实线样式
-            "color": "black",  # 黑色
-            "alpha": 0.8,  # 较高的不透明度
-            "width": 0.6  # 较细的线宽
-        }
-    })
+    box_params: BoxParams = field(default_factory=BoxParams)  # 箱体参数
+    whisker_params: WhiskerParams = field(default_factory=WhiskerParams)  # 须线参数
+    median_params: MedianParams = field(default_factory=MedianParams)  # 中位线参数
+    outlier_params: OutlierParams = field(default_factory=OutlierParams)  # 离群点参数
+    group_params: GroupParams = field(default_factory=GroupParams)  # 分组参数
+    _style_dict_cache: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # 样式字典缓存：(相关参数取值, 样式字典)
+    _colors_cache: Optional[Tuple[Tuple[int, int, int], Tuple[Any, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )  # 颜色缓存：((分组大小, 调色板缓存代数, 箱子数), 颜色元组)
+    
+    def __post_init__(self):
+        self._coerce_params()
+    
+    def _coerce_params(self) -> None:
+        """将以字典形式给出的参数转换为对应的参数类型"""
+        for name, param_type in _PARAM_TYPES.items():
+            value = getattr(self, name)
+            if isinstance(value, dict):
+                setattr(self, name, param_type(**value))
+    
+    def _invalidate(self, key: str) -> None:
+        """整体替换的参数字典转换为参数类型"""
+        if key in _PARAM_TYPES:
+            self._coerce_params()
     
     def get_style_dict(self) -> Dict[str, Any]:
         """获取箱型图样式字典
         
         将配置参数转换为seaborn.boxplot函数可用的样式字典。
+        结果以箱体、须线、中位线和离群点参数的取值为键缓存，参数取值改变后重新构建，
+        返回的字典为缓存对象，不应修改。
         
         Returns:
             样式参数字典
@@ -111,30 +253,46 @@ class BoxPlotConfig(BasePlotConfig):
             sns.boxplot(**style_dict)
             ```
         """
-        return {
-            "width": self.box_params["width"],
+        box = self.box_params
+        whisker = self.whisker_params
+        median = self.median_params
+        outlier = self.outlier_params
+        values = (
+            box.width, box.alpha, box.linewidth, box.notch, box.showfliers,
+            whisker.linewidth, whisker.style,
+            median.color, median.linewidth,
+            outlier.marker, outlier.size, outlier.alpha, outlier.color
+        )
+        cache = self._style_dict_cache
+        if cache is not None and cache[0] == values:
+            return cache[1]
+        
+        style_dict = {
+            "width": box.width,
             "boxprops": {
-                "alpha": self.box_params["alpha"], 
-                "linewidth": self.box_params["linewidth"]
+                "alpha": box.alpha, 
+                "linewidth": box.linewidth
             },
             "whiskerprops": {
-                "linewidth": self.whisker_params["linewidth"], 
-                "linestyle": self.whisker_params["style"]
+                "linewidth": whisker.linewidth, 
+                "linestyle": whisker.style
             },
             "medianprops": {
-                "color": self.median_params["color"], 
-                "linewidth": self.median_params["linewidth"]
+                "color": median.color, 
+                "linewidth": median.linewidth
             },
             "flierprops": {
-                "marker": self.outlier_params["marker"],
-                "markersize": self.outlier_params["size"],
-                "alpha": self.outlier_params["alpha"],
-                "markerfacecolor": self.outlier_params["color"],
-                "markeredgewidth": self.box_params["linewidth"]
+                "marker": outlier.marker,
+                "markersize": outlier.size,
+                "alpha": outlier.alpha,
+                "markerfacecolor": outlier.color,
+                "markeredgewidth": box.linewidth
             },
-            "notch": self.box_params["notch"],
-            "showfliers": self.box_params["showfliers"]
+            "notch": box.notch,
+            "showfliers": box.showfliers
         }
+        self._style_dict_cache = (values, style_dict)
+        return style_dict
     
     def get_colors(self, num_boxes: int) -> List[str]:
         """获取箱型图颜色列表
@@ -154,16 +312,22 @@ class BoxPlotConfig(BasePlotConfig):
             ```
         
         注意：
-            - 颜色数量由group_params["size"]决定
-            - 使用seaborn默认调色板
+            - 颜色数量由group_params.size决定
+            - 使用seaborn默认调色板，首次读取后在进程内缓存，
+              修改默认调色板后需调用clear_palette_cache()
             - 颜色会循环使用以匹配箱子数量
+            - 结果按分组大小和箱子数缓存，分组大小改变后重新生成
         """
-        group_size = self.group_params["size"]
-        # 计算需要的基础颜色数量（等于每组的箱子数）
-        base_colors = list(sns.color_palette())[:group_size]
+        group_size = self.group_params.size
+        key = (group_size, _palette_generation, num_boxes)
+        cache = self._colors_cache
+        if cache is not None and cache[0] == key:
+            return list(cache[1])
+        
+        # 基础颜色数量等于每组的箱子数
+        base_colors = _base_palette(group_size)
         # 重复基础颜色以匹配总箱子数
-        colors = []
-        num_groups = (num_boxes + group_size - 1) // group_size  # 向上取整
-        for i in range(num_groups):
-            colors.extend(base_colors)
-        return colors[:num_boxes]
\ No newline at end of file
+        num_groups = -(-num_boxes // group_size)  # 向上取整
+        colors = (base_colors * num_groups)[:num_boxes]
+        self._colors_cache = (key, colors)
+        return list(colors)
\ No newline at end of file
@@ -60,13 +60,14 @@ class BoxPlotter(BasePlotter):
         ```
     """
     
-    def __init__(self, config: Optional[BoxPlotConfig] = None):
+    def __init__(self, config: Optional[BoxPlotConfig] = None, reuse_figure: bool = True):
         """初始化箱型图绘制器
         
         创建绘图器实例并进行必要的初始化。
         
         Args:
             config: 箱型图配置对象，如果为None则使用默认配置
+            reuse_figure: 是否在多次绘图之间复用图形对象
             
         Raises:
             ValueError: 当配置无效时抛出
@@ -81,24 +82,28 @@ class BoxPlotter(BasePlotter):
             plotter = BoxPlotter(config)
             ```
         """
-        super().__init__(config or BoxPlotConfig())
+        super().__init__(config or BoxPlotConfig(), reuse_figure=reuse_figure)
         self.data_list: List[Any] = []  # 存储处理后的数据
         self.labels: List[str] = []  # 存储数据标签
-        self.style_manager = BoxStyleManager(self.config)  # 创建样式管理器
     
-    def validate_config(self) -> None:
-        """验证配置有效性
+    def _create_style_manager(self) -> BoxStyleManager:
+        """创建箱型图样式管理器
         
-        检查箱型图配置参数是否满足要求。
+        Returns:
+            箱型图样式管理器对象
+        """
+        return BoxStyleManager(self.config)
+    
+    def _collect_config_errors(self) -> List[str]:
+        """收集配置中的全部错误信息
         
-        Raises:
-            ValueError: 当配置参数无效时抛出
+        Returns:
+            错误信息列表，配置全部合法时返回空列表
             
         注意：
             除了基础配置，还会验证箱型图特有的配置
         """
-        super().validate_config()
-        ConfigValidator.validate_box_config(self.config)
+        return super()._collect_config_errors() + ConfigValidator.collect_box_errors(self.config)
     
     def validate_data(self, data: Dict[str, Any]) -> None:
         """验证数据有效性
@@ -137,14 +142,14 @@ class BoxPlotter(BasePlotter):
     def config(self, value: BoxPlotConfig) -> None:
         """设置配置对象
         
-        更新配置并重新创建样式管理器。
+        更新配置并标记为待验证，验证推迟到下次调用plot()时进行，
+        样式管理器在下次使用时重新创建。
         
         Args:
             value: 新的配置对象
             
         Raises:
             TypeError: 配置类型错误时抛出
-            ValueError: 配置无效时抛出
             
         示例：
             ```python
@@ -156,10 +161,7 @@ class BoxPlotter(BasePlotter):
         if not isinstance(value, BoxPlotConfig):
             raise TypeError("配置必须是BoxPlotConfig类型")
         self._config = value
-        self.style_manager = BoxStyleManager(value)
-        
-        # 验证新配置
-        self.validate_config()
+        self._config_dirty = True
     
     def prepare_data(self, data: Dict[str, Any]) -> None:
         """准备绘图数据
@@ -189,13 +191,15 @@ class BoxPlotter(BasePlotter):
         self.labels = list(values.keys())  # 提取标签
         
         # 设置标签
-        x_label = data["metadata"].get("x_label", "类别")
-        y_label = data["metadata"].get("y_label", "数值")
-        unit = data["metadata"].get("unit", "")
-        
-        self.config.element.xlabel = self.config.element.xlabel if self.config.element.xlabel else x_label
-        self.config.element.ylabel = self.config.element.ylabel if self.config.element.ylabel else (y_label + f" ({unit})" if unit else y_label)
-        self.config.element.title = self.config.element.title if self.config.element.title else f"{y_label}按{x_label}的分布"
+        metadata = data["metadata"]
+        x_label = metadata.get("x_label", "类别")
+        y_label = metadata.get("y_label", "数值")
+        unit = metadata.get("unit", "")
+        
+        element = self.config.element
+        element.xlabel = element.xlabel or x_label
+        element.ylabel = element.ylabel or (f"{y_label} ({unit})" if unit else y_label)
+        element.title = element.title or f"{y_label}按{x_label}的分布"
     
     def draw_plot(self) -> None:
         """绘制箱型图
@@ -211,7 +215,8 @@ class BoxPlotter(BasePlotter):
         """
         try:
             # 获取样式
-            colors = self.config.get_colors(len(self.data_list))
+            num_boxes = len(self.data_list)
+            colors = self.config.get_colors(num_boxes)
             style_dict = self.config.get_style_dict()
             
             # 绘制箱型图
@@ -222,32 +227,26 @@ class BoxPlotter(BasePlotter):
                 **style_dict
             )
             
-            # 设置刻度标签
-            self.ax.set_xticks(range(len(self.labels)))
-            self.ax.set_xticklabels(self.labels)
+            # 设置刻度位置和标签
+            self.ax.set_xticks(range(num_boxes), labels=self.labels)
         except Exception as e:
-            raise RuntimeError(f"箱型图绘制失败: {str(e)}")
+            raise RuntimeError(f"箱型图绘制失败: {str(e)}") from e
     
     def apply_specific_style(self) -> None:
         """应用箱型图特有样式
         
         设置箱型图的特定样式和分组样式。
-        
-        Raises:
-            RuntimeError: 样式应用失败时抛出
             
         注意：
             - 会应用箱体样式
             - 会处理分组样式
+            - 由apply_style调用，异常由其统一包装为RuntimeError
         """
         if self.ax is None:
             return
             
-        try:
-            # 应用箱型图样式
-            self.style_manager.apply_box_style(self.ax)
-            
-            # 应用分组样式
-            self.style_manager.apply_group_style(self.ax, len(self.data_list))
-        except Exception as e:
-            raise RuntimeError(f"箱型图样式应用失败: {str(e)}")
+        # 应用箱型图样式
+        self.style_manager.apply_box_style(self.ax)
+        
+        # 应用分组样式
+        self.style_manager.apply_group_style(self.ax, len(self.data_list))
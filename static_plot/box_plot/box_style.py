@@ -2,13 +2,20 @@
 箱型图样式管理器类，继承自BaseStyleManager，提供了箱型图特有的样式管理功能。
 """
 
-from typing import Any, List
+from __future__ import annotations
 
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING, Any, List
+
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.patches import PathPatch
 
 from static_plot.base.base_style import BaseStyleManager
 from static_plot.box_plot.box_config import BoxPlotConfig
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 
 class BoxStyleManager(BaseStyleManager):
     """箱型图样式管理器类
@@ -79,10 +86,7 @@ class BoxStyleManager(BaseStyleManager):
             return
             
         # 获取箱子对象
-        box_patches = [patch for patch in ax.patches 
-                      if hasattr(patch, 'get_facecolor')]
-        if len(box_patches) == 0:  # 对于老版本matplotlib，boxes存储在artists中
-            box_patches = ax.artists
+        box_patches = [patch for patch in ax.patches if isinstance(patch, PathPatch)]
         
         # 应用样式
         self._apply_box_colors(ax, box_patches)
@@ -99,47 +103,30 @@ class BoxStyleManager(BaseStyleManager):
         注意：
             - 颜色会应用到箱体、须线和离群点
             - 保持颜色的一致性
+            - 箱体设置为空心
+            - 每个箱子的线条依次为须线、顶端线、中位线和离群点，
+              只有离群点（最后一条线）需要设置标记颜色
         """
         num_patches = len(patches)
-        lines_per_boxplot = len(ax.lines) // num_patches
-        
-        for i, patch in enumerate(patches):
-            self._style_single_box(ax, patch, i, lines_per_boxplot)
-    
-    def _style_single_box(
-        self, 
-        ax: plt.Axes, 
-        patch: Any, 
-        index: int, 
-        lines_per_box: int
-    ) -> None:
-        """设置单个箱子的样式
-        
-        配置单个箱子及其关联元素的样式。
+        if num_patches == 0:
+            return
+        # ArtistList每次切片都会遍历坐标轴的全部子对象，先转换为列表
+        lines = list(ax.lines)
+        lines_per_box = len(lines) // num_patches
+        if lines_per_box == 0:
+            return
         
-        Args:
-            ax: matplotlib坐标轴对象
-            patch: 箱子对象
-            index: 箱子索引
-            lines_per_box: 每个箱子的线条数
+        starts = range(0, num_patches * lines_per_box, lines_per_box)
+        for patch, start in zip(patches, starts):
+            col = patch.get_facecolor()
+            patch.set_edgecolor(col)
+            patch.set_facecolor('None')  # 设置箱子为空心
             
-        注意：
-            - 箱体设置为空心
-            - 所有关联元素使用相同的颜色
-        """
-        # 获取并设置箱子颜色
-        col = patch.get_facecolor()
-        patch.set_edgecolor(col)
-        patch.set_facecolor('None')  # 设置箱子为空心
-        
-        # 设置关联的所有线条颜色
-        start_idx = index * lines_per_box
-        end_idx = (index + 1) * lines_per_box
-        
-        for line in ax.lines[start_idx:end_idx]:
-            line.set_color(col)
-            line.set_mfc(col)  # 异常点填充色
-            line.set_mec(col)  # 异常点边框色
+            box_lines = lines[start:start + lines_per_box]
+            for line in box_lines[:-1]:
+                line.set_color(col)
+            # 离群点一次性设置线条、标记填充色和边框色
+            box_lines[-1].update({"color": col, "mfc": col, "mec": col})
     
     def apply_group_style(self, ax: plt.Axes, num_boxes: int) -> None:
         """应用分组样式
@@ -159,20 +146,29 @@ class BoxStyleManager(BaseStyleManager):
             style_manager.apply_group_style(ax, 8)  # 8个箱子
             ```
         """
-        if not self.config.group_params["divider"]["show"]:
+        group = self.config.group_params
+        divider = group.divider
+        if not divider.show:
             return
             
-        group_size = self.config.group_params["size"]
-        divider = self.config.group_params["divider"]
+        group_size = group.size
         
-        # 添加分组分隔线
-        for i in range(group_size, num_boxes, group_size):
-            if i < num_boxes:
-                ax.axvline(
-                    i - 0.5,
-                    linestyle=divider["style"],
-                    color=divider["color"],
-                    alpha=divider["alpha"],
-                    linewidth=divider["width"],
-                    zorder=1
-                ) 
\ No newline at end of file
+        # 添加分组分隔线：所有分隔线合并为一个LineCollection，
+        # y方向使用坐标轴坐标，始终贯穿整个绘图区且不影响y轴范围
+        positions = np.arange(group_size, num_boxes, group_size) - 0.5
+        if positions.size == 0:
+            return
+        segments = np.empty((positions.size, 2, 2))
+        segments[:, :, 0] = positions[:, None]
+        segments[:, :, 1] = (0, 1)
+        dividers = LineCollection(
+            segments,
+            transform=ax.get_xaxis_transform(),
+            linestyles=divider.style,
+            colors=divider.color,
+            alpha=divider.alpha,
+            linewidths=divider.width,
+            zorder=1
+        )
+        # autolim=False：不更新数据范围，保留seaborn设置的分类轴范围
+        ax.add_collection(dividers, autolim=False)